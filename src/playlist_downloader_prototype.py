@@ -14,192 +14,415 @@ Run:
 import sys
 import os
 import json
+import re
+import hashlib
+import shutil
 import threading
 import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from queue import Queue
+from queue import Queue, Empty
 from functools import partial
 
-from PySide6.QtCore import Qt, Signal, QObject
+from PySide6.QtCore import (
+    Qt, Signal, QObject, QAbstractListModel, QModelIndex, QRect, QSize, QRunnable, QThreadPool,
+    QTimer
+)
+from PySide6.QtGui import QFont, QPalette
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QPushButton, QFileDialog, QListWidget, QListWidgetItem, QProgressBar,
-    QCheckBox, QComboBox, QSpinBox, QTextEdit, QMessageBox, QFrame
+    QPushButton, QFileDialog, QListView, QProgressBar, QCheckBox, QComboBox,
+    QSpinBox, QPlainTextEdit, QMessageBox, QFrame, QStyle, QStyledItemDelegate,
+    QStyleOptionViewItem, QStyleOptionProgressBar
 )
 
 # yt_dlp import must be installed
 try:
     import yt_dlp
+    from yt_dlp.utils import DownloadCancelled, DownloadError, ReExtractInfo
 except Exception as e:
     raise RuntimeError("yt_dlp module not found. Run: pip install yt-dlp") from e
 
 # ------------------------------
-# Helper signals object to safely update UI from worker threads
+# Helper signals object to safely update UI from worker threads.
+# Per-tick progress bypasses it: workers put it on a queue the UI drains on a timer.
 # ------------------------------
 class Signals(QObject):
-    update_progress = Signal(str, float, int, int, str)  
     update_status = Signal(str, str)  
     finished_video = Signal(str, bool, str)  
 
-signals = Signals()
-
 # ------------------------------
-# Per-item widget in the list
+# Playlist rows: plain dicts in a list model, painted by a delegate
 # ------------------------------
-class VideoWidget(QWidget):
-    def __init__(self, info):
-        super().__init__()
-        self.info = info
-        self.video_id = info.get('id') or info.get('url') or info.get('webpage_url')
-        self.title = info.get('title', self.video_id)
-        self.duration = info.get('duration')
-        self.url = info.get('url') if info.get('url') else info.get('webpage_url')
-        self.init_ui()
-
-    def init_ui(self):
-        main = QHBoxLayout()
-        main.setContentsMargins(6,6,6,6)
-
-        self.checkbox = QCheckBox()
-        self.checkbox.setChecked(True)
-        main.addWidget(self.checkbox)
-
-        leftcol = QVBoxLayout()
-        title = QLabel(self.title)
-        title.setToolTip(self.title)
-        leftcol.addWidget(title)
-
-        meta = QLabel(f"Duration: {self._fmt_duration(self.duration)}")
-        meta.setStyleSheet("color: #666; font-size: 11px;")
-        leftcol.addWidget(meta)
-        main.addLayout(leftcol)
-
-        spacer = QHBoxLayout()
-        spacer.addStretch()
-        main.addLayout(spacer)
-
-        rightcol = QVBoxLayout()
-        self.status_label = QLabel("Queued")
-        rightcol.addWidget(self.status_label)
-
-        self.progress = QProgressBar()
-        self.progress.setRange(0, 100)
-        self.progress.setValue(0)
-        self.progress.setFixedWidth(300)
-        rightcol.addWidget(self.progress)
-        main.addLayout(rightcol)
-
-        self.setLayout(main)
-        self.setMinimumHeight(64)
-
-    def _fmt_duration(self, d):
-        if not d:
-            return "–"
-        h = d // 3600
-        m = (d % 3600) // 60
-        s = d % 60
-        if h:
-            return f"{h:d}:{m:02d}:{s:02d}"
-        return f"{m:d}:{s:02d}"
-
-    def set_progress(self, percent, downloaded_bytes, total_bytes, status_text):
-        if percent is None:
-            self.progress.setValue(0)
+ProgressRole = Qt.UserRole + 1
+StatusRole = Qt.UserRole + 2
+DurationRole = Qt.UserRole + 3
+
+class PlaylistModel(QAbstractListModel):
+    # Rows are stored column-wise: parallel sequences indexed by row number.
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._load_columns([])
+
+    def _load_columns(self, entries):
+        ids = [e.get('id') or e.get('url') or e.get('webpage_url') for e in entries]
+        n = len(entries)
+        self._ids = ids
+        self._entries = list(entries)
+        self._titles = [e.get('title') or vid for e, vid in zip(entries, ids)]
+        self._durations = [e.get('duration') for e in entries]
+        self._checked = bytearray(b'\x01') * n
+        self._percent = array('f', bytes(4 * n))
+        self._status = ["Queued"] * n
+        self._row_by_id = {vid: i for i, vid in enumerate(ids)}
+
+    def set_entries(self, entries):
+        self.beginResetModel()
+        self._load_columns(entries)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid():
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return self._titles[row]
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if self._checked[row] else Qt.Unchecked
+        if role == ProgressRole:
+            return self._percent[row]
+        if role == StatusRole:
+            return self._status[row]
+        if role == DurationRole:
+            return self._durations[row]
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid():
+            return False
+        row = index.row()
+        if role == Qt.CheckStateRole:
+            self._checked[row] = Qt.CheckState(value) == Qt.Checked
+        elif role == ProgressRole:
+            self._percent[row] = value or 0.0
+        elif role == StatusRole:
+            self._status[row] = value
         else:
-            try:
-                p = int(percent)
-            except:
-                p = 0
-            self.progress.setValue(p)
-        self.status_label.setText(status_text)
+            return False
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def row_of(self, video_id):
+        return self._row_by_id.get(video_id, -1)
+
+    def set_progress(self, row, percent, status_text):
+        self._percent[row] = percent or 0.0
+        self._status[row] = status_text
+        idx = self.index(row)
+        self.dataChanged.emit(idx, idx, [ProgressRole, StatusRole])
+
+    def set_progress_many(self, updates):
+        # updates: {row: (percent, status_text)}, reported as one dataChanged span
+        if not updates:
+            return
+        pct, status = self._percent, self._status
+        for row, (percent, status_text) in updates.items():
+            pct[row] = percent or 0.0
+            status[row] = status_text
+        self.dataChanged.emit(self.index(min(updates)), self.index(max(updates)),
+                              [ProgressRole, StatusRole])
+
+    def set_status(self, row, status_text):
+        self.setData(self.index(row), status_text, StatusRole)
+
+    def set_all_checked(self, checked):
+        n = len(self._ids)
+        if not n:
+            return
+        self._checked[:] = (b'\x01' if checked else b'\x00') * n
+        self.dataChanged.emit(self.index(0), self.index(n - 1), [Qt.CheckStateRole])
+
+    def checked_entries(self):
+        return [(vid, e) for vid, e, c in zip(self._ids, self._entries, self._checked) if c]
+
+class PlaylistDelegate(QStyledItemDelegate):
+    MARGIN = 6
+    PROGRESS_WIDTH = 300
+    # Every row has the same geometry, so the hint is a constant
+    _ROW_SIZE = QSize(0, 64)
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        widget = opt.widget
+        style = widget.style() if widget else QApplication.style()
+
+        # Background, selection and check indicator come from the style; text is ours.
+        opt.text = ""
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, widget)
+
+        m = self.MARGIN
+        rect = option.rect.adjusted(m, m, -m, -m)
+        half = rect.height() // 2
+        check = style.subElementRect(QStyle.SE_ItemViewItemCheckIndicator, opt, widget)
+        right = QRect(rect.right() - self.PROGRESS_WIDTH + 1, rect.top(), self.PROGRESS_WIDTH, rect.height())
+        left = QRect(check.right() + m, rect.top(), right.left() - check.right() - 3 * m, rect.height())
+
+        selected = bool(option.state & QStyle.State_Selected)
+        text_role = QPalette.HighlightedText if selected else QPalette.Text
+
+        painter.save()
+        painter.setPen(option.palette.color(text_role))
+        title = option.fontMetrics.elidedText(index.data(Qt.DisplayRole), Qt.ElideRight, left.width())
+        painter.drawText(QRect(left.left(), left.top(), left.width(), half),
+                         Qt.AlignLeft | Qt.AlignVCenter, title)
+        painter.drawText(QRect(right.left(), right.top(), right.width(), half),
+                         Qt.AlignLeft | Qt.AlignVCenter, index.data(StatusRole))
+        meta_font = QFont(option.font)
+        meta_font.setPixelSize(11)
+        painter.setFont(meta_font)
+        if not selected:
+            painter.setPen(Qt.gray)
+        painter.drawText(QRect(left.left(), left.top() + half, left.width(), rect.height() - half),
+                         Qt.AlignLeft | Qt.AlignVCenter,
+                         f"Duration: {fmt_duration(index.data(DurationRole))}")
+        painter.restore()
+
+        bar = QStyleOptionProgressBar()
+        bar.rect = QRect(right.left(), right.top() + half, right.width(), rect.height() - half)
+        bar.state = option.state | QStyle.State_Horizontal
+        bar.minimum = 0
+        bar.maximum = 100
+        bar.progress = int(index.data(ProgressRole) or 0)
+        bar.text = f"{bar.progress}%"
+        bar.textVisible = True
+        QApplication.style().drawControl(QStyle.CE_ProgressBar, bar, painter)
+
+    def sizeHint(self, option, index):
+        return self._ROW_SIZE
+
+def fmt_duration(d):
+    if not d:
+        return "–"
+    d = int(d)
+    h = d // 3600
+    m = (d % 3600) // 60
+    s = d % 60
+    if h:
+        return f"{h:d}:{m:02d}:{s:02d}"
+    return f"{m:d}:{s:02d}"
+
+# Minimum gap between 'downloading' progress emits per video (10 Hz)
+PROGRESS_INTERVAL_NS = 100_000_000
 
-    def set_status_text(self, text):
-        self.status_label.setText(text)
+# ------------------------------
+# Download a single video using yt_dlp (runs on a pool thread)
+# ------------------------------
+def run_download(video_entry, out_dir, opts, archive_path, signals, progress, stop):
+    video_id = video_entry.get('id') or video_entry.get('url') or video_entry.get('webpage_url')
+    last_emit = 0
+    if stop.is_set():
+        return
+
+    def progress_hook(d):
+        nonlocal last_emit
+        if stop.is_set():
+            # Raising from the hook is the only way to abort a yt_dlp download mid-transfer.
+            raise DownloadCancelled("Window closed")
+        status = d.get('status')
+        if status == 'downloading':
+            now = time.monotonic_ns()
+            if now - last_emit < PROGRESS_INTERVAL_NS:
+                return
+            last_emit = now
+            # Only ticks that survive the throttle pay for formatting.
+            downloaded = d.get('downloaded_bytes') or 0
+            total = int(d.get('total_bytes') or d.get('total_bytes_estimate') or -1)
+            percent = d.get('_percent')
+            if not isinstance(percent, (int, float)):
+                percent = 100.0 * downloaded / total if total > 0 else 0.0
+            fmt = fmt_bytes
+            status_text = (f"Downloading {percent:.1f}% • {fmt(downloaded)} / "
+                           f"{fmt(total) if total != -1 else '?'} • {fmt(d.get('speed') or 0)}/s")
+            progress.put((video_id, float(percent), status_text))
+        elif status == 'finished':
+            progress.put((video_id, 100.0, "Processing/merging"))
+        elif status == 'error':
+            signals.update_status.emit(video_id, "Error")
+
+    ydl_opts = opts.copy()
+    tpl = ydl_opts.pop('outtmpl', None) or "%(playlist_index)03d - %(title)s.%(ext)s"
+    if archive_path:
+        ydl_opts['download_archive'] = archive_path
+    ydl_opts.setdefault('quiet', True)
+    ydl_opts.setdefault('no_warnings', True)
+
+    ydl = _thread_ydl(ydl_opts)
+    ydl.params['outtmpl']['default'] = os.path.join(out_dir, tpl)
+    _tls.progress_hook = progress_hook
+    signals.update_status.emit(video_id, "Starting")
+    if video_entry.get('formats'):
+        # Resolved entries download straight from their formats. Those URLs are signed and
+        # expire, so like yt_dlp's download_with_info_file, re-resolve the page when they fail.
+        # The entry is a copy: yt_dlp rewrites fields of the result it is given.
+        try:
+            ydl.process_ie_result(dict(video_entry), download=True)
+        except (DownloadError, ReExtractInfo):
+            webpage_url = video_entry.get('webpage_url')
+            if webpage_url is None or stop.is_set():
+                raise
+            signals.update_status.emit(video_id, "Retrying with fresh formats")
+            ydl.download([webpage_url])
+    elif video_entry.get('_type') in ('url', 'url_transparent'):
+        # Flat entries keep their ie_key and are resolved at download time.
+        ydl.process_ie_result(dict(video_entry), download=True)
+    else:
+        url = video_entry.get('webpage_url') or video_entry.get('url') or video_entry.get('id')
+        ydl.download([url])
+
+# One YoutubeDL per pool thread: constructing one loads every extractor.
+_tls = threading.local()
+
+def _thread_ydl(opts):
+    key = json.dumps(opts, sort_keys=True, default=str)
+    ydl = getattr(_tls, 'ydl', None)
+    if ydl is None or _tls.key != key:
+        if ydl is not None:
+            ydl.close()
+        ydl = yt_dlp.YoutubeDL(opts.copy())
+        # Hooks are bound at construction, so dispatch to whichever download is current.
+        ydl.add_progress_hook(lambda d: _tls.progress_hook(d))
+        _tls.ydl = ydl
+        _tls.key = key
+    elif opts.get('download_archive'):
+        # yt_dlp reads the archive only in __init__; pick up IDs other threads recorded since.
+        ydl.archive = load_archive(opts['download_archive'])
+    return ydl
+
+def load_archive(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return {line.strip() for line in f}
+    except FileNotFoundError:
+        return set()
+
+_BYTE_UNITS = ("B", "KB", "MB", "GB")
+
+def fmt_bytes(b):
+    if not isinstance(b, (int, float)):
+        return "?"
+    b = int(b)
+    if b < 1024:
+        return f"{b}B"
+    # bit_length picks the 1024-power directly instead of comparing against each unit
+    i = min((b.bit_length() - 1) // 10, 3)
+    return f"{b / (1 << (i * 10)):.1f}{_BYTE_UNITS[i]}"
 
 # ------------------------------
-# Worker that downloads a single video using yt_dlp
+# Playlist metadata fetch (runs on the Qt thread pool, cached on disk)
 # ------------------------------
-class DownloadWorker(threading.Thread):
-    def __init__(self, video_entry, out_dir, opts, archive_path):
-        super().__init__(daemon=True)
-        self.entry = video_entry
-        self.out_dir = out_dir
-        self.opts = opts.copy()
-        self.archive_path = archive_path
-        self.video_id = self.entry.get('id') or self.entry.get('url') or self.entry.get('webpage_url')
-        self._stop = threading.Event()
+META_CACHE_DIR = Path.home() / ".playlist_cache"
+META_CACHE_TTL = 3600  # seconds
+
+def _meta_cache_path(url):
+    key = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+    return META_CACHE_DIR / f"{key}.json"
+
+def load_cached_info(url):
+    path = _meta_cache_path(url)
+    try:
+        if time.time() - path.stat().st_mtime >= META_CACHE_TTL:
+            return None
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def store_cached_info(url, info):
+    path = _meta_cache_path(url)
+    tmp = path.with_suffix('.tmp')
+    try:
+        META_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(info, f)
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError):
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+def fetch_info(url):
+    info = load_cached_info(url)
+    if info is not None:
+        return info
+    ydl_opts = {'quiet': True, 'extract_flat': 'in_playlist', 'skip_download': True}
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        # sanitize_info drops the non-JSON-serializable bits so the result can be cached
+        info = ydl.sanitize_info(ydl.extract_info(url, download=False))
+    store_cached_info(url, info)
+    return info
+
+class FetchSignals(QObject):
+    info_ready = Signal(object)
+    info_error = Signal(str)
+
+class FetchRunnable(QRunnable):
+    def __init__(self, url):
+        super().__init__()
+        self.url = url
+        self.signals = FetchSignals()
 
     def run(self):
-        def progress_hook(d):
-            status = d.get('status')
-            if status == 'downloading':
-                downloaded = d.get('downloaded_bytes') or 0
-                total = d.get('total_bytes') or d.get('total_bytes_estimate') or -1
-                percent = d.get('_percent_str')
-                percent_float = None
-                try:
-                    if 'percent' in d:
-                        percent_float = float(d['percent'])
-                    elif percent:
-                        percent_float = float(percent.strip().strip('%'))
-                except:
-                    percent_float = None
-                speed = d.get('speed') or 0
-                status_text = f"Downloading {percent_float:.1f}% • {self._fmt_bytes(downloaded)} / "
-                status_text += f"{self._fmt_bytes(total) if total!=-1 else '?'} • {self._fmt_bytes(speed)}/s"
-                signals.update_progress.emit(self.video_id, percent_float or 0.0, downloaded, total if total else -1, status_text)
-            elif status == 'finished':
-                signals.update_progress.emit(self.video_id, 100.0, d.get('downloaded_bytes') or 0, d.get('total_bytes') or -1, "Processing/merging")
-            elif status == 'error':
-                signals.update_status.emit(self.video_id, "Error")
-
-        ydl_opts = self.opts.copy()
-        tpl = ydl_opts.get('outtmpl') or "%(playlist_index)03d - %(title)s.%(ext)s"
-        ydl_opts['outtmpl'] = os.path.join(self.out_dir, tpl)
-        if self.archive_path:
-            ydl_opts['download_archive'] = self.archive_path
-        ydl_opts['progress_hooks'] = [progress_hook]
-        ydl_opts.setdefault('quiet', True)
-        ydl_opts.setdefault('no_warnings', True)
-
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                url = self.entry.get('webpage_url') or self.entry.get('url') or self.entry.get('id')
-                signals.update_status.emit(self.video_id, "Starting")
-                ydl.download([url])
-            signals.finished_video.emit(self.video_id, True, "Done")
+            info = fetch_info(self.url)
         except Exception as e:
-            signals.finished_video.emit(self.video_id, False, str(e))
+            self.signals.info_error.emit(str(e))
+            return
+        self.signals.info_ready.emit(info)
 
-    def _fmt_bytes(self, b):
-        try:
-            b = float(b)
-        except:
-            return "?"
-        if b < 1024:
-            return f"{b:.0f}B"
-        if b < 1024**2:
-            return f"{b/1024:.1f}KB"
-        if b < 1024**3:
-            return f"{b/(1024**2):.1f}MB"
-        return f"{b/(1024**3):.1f}GB"
+# Everything except alphanumerics (Unicode-aware, like str.isalnum), space, '.', '_' and '-'
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w .\-]+")
 
 # ------------------------------
 # Main window
 # ------------------------------
 class MainWindow(QWidget):
+    # Named quality presets; numeric ones ("1080", "720", ...) cap the height instead
+    _FORMAT_MAP = {
+        "best": "best",
+        "bestvideo+bestaudio": "bestvideo+bestaudio/best",
+        "audio": "bestaudio",
+    }
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Playlist Downloader — Prototype")
         self.resize(1000, 700)
 
         self.playlist = None
-        self.video_widgets = {}
-        self.queue = Queue()
-        self.active_workers = []
+        self._cached_safe_title = None
+        self.signals = Signals()
+        self.progress_queue = Queue()
         self.max_concurrent = 3
         self.download_opts = {}
         self.download_archive = os.path.join(os.getcwd(), "downloaded.txt")
+        self._fetch_signals = None
+        self._pool = ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix="dl")
+        # future -> (video_id, run_download args); only touched on the UI thread
+        self._jobs = {}
+        # Set on close: pool threads are joined at interpreter exit, so running downloads must abort
+        self._stop = threading.Event()
 
         layout = QVBoxLayout(self)
 
@@ -207,7 +430,12 @@ class MainWindow(QWidget):
         self.url_input = QLineEdit()
         self.url_input.setPlaceholderText("Paste playlist or channel URL here...")
         self.fetch_btn = QPushButton("Fetch")
+        self.fetch_busy = QProgressBar()
+        self.fetch_busy.setRange(0, 0)
+        self.fetch_busy.setFixedWidth(120)
+        self.fetch_busy.hide()
         urlrow.addWidget(self.url_input)
+        urlrow.addWidget(self.fetch_busy)
         urlrow.addWidget(self.fetch_btn)
         layout.addLayout(urlrow)
 
@@ -226,12 +454,20 @@ class MainWindow(QWidget):
         self.per_playlist_folder_cb = QCheckBox("Create subfolder per playlist")
         self.archive_cb = QCheckBox("Use download archive (skip downloaded)")
         self.archive_cb.setChecked(True)
+        self.aria2c_cb = QCheckBox("Use aria2c")
+        if shutil.which("aria2c"):
+            # yt_dlp reports no progress from aria2c, so rows would sit at 0% until done
+            self.aria2c_cb.setToolTip("Parallel segment downloads; per-video progress is not shown")
+        else:
+            self.aria2c_cb.setEnabled(False)
+            self.aria2c_cb.setToolTip("aria2c was not found in PATH")
         optsrow.addWidget(QLabel("Quality:"))
         optsrow.addWidget(self.quality_combo)
         optsrow.addWidget(QLabel("Concurrency:"))
         optsrow.addWidget(self.concurrent_spin)
         optsrow.addWidget(self.per_playlist_folder_cb)
         optsrow.addWidget(self.archive_cb)
+        optsrow.addWidget(self.aria2c_cb)
         layout.addLayout(optsrow)
 
         control_row = QHBoxLayout()
@@ -246,12 +482,18 @@ class MainWindow(QWidget):
 
         middle = QHBoxLayout()
 
-        self.list_widget = QListWidget()
-        middle.addWidget(self.list_widget, 3)
+        self.model = PlaylistModel(self)
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setItemDelegate(PlaylistDelegate(self.list_view))
+        middle.addWidget(self.list_view, 3)
 
         rightside = QVBoxLayout()
-        self.status_console = QTextEdit()
+        self.status_console = QPlainTextEdit()
         self.status_console.setReadOnly(True)
+        self.status_console.setMaximumBlockCount(500)
+        self._console_buf = []
         rightside.addWidget(QLabel("Console"))
         rightside.addWidget(self.status_console)
         middle.addLayout(rightside, 2)
@@ -271,39 +513,47 @@ class MainWindow(QWidget):
         self.download_selected_btn.clicked.connect(self.on_download_selected)
         self.concurrent_spin.valueChanged.connect(self.on_concurrency_changed)
 
-        signals.update_progress.connect(self.on_update_progress)
-        signals.update_status.connect(self.on_update_status)
-        signals.finished_video.connect(self.on_finished_video)
+        self.signals.update_status.connect(self.on_update_status)
+        self.signals.finished_video.connect(self.on_finished_video)
+
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(100)
+        self._progress_timer.timeout.connect(self._drain_progress)
+        self._progress_timer.start()
+
+        # sys._is_gil_enabled only exists on 3.13+; free-threaded builds let pool threads run in parallel
+        if not getattr(sys, "_is_gil_enabled", lambda: True)():
+            self.log("Free-threaded Python: download workers run without the GIL")
 
     def on_fetch(self):
         url = self.url_input.text().strip()
         if not url:
             QMessageBox.warning(self, "No URL", "Please paste a playlist or channel URL.")
             return
-        self.status_console.append("Fetching playlist metadata...")
-        QApplication.setOverrideCursor(Qt.WaitCursor)
-        try:
-            ydl_opts = {'quiet': True, 'extract_flat': 'in_playlist', 'skip_download': True}
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-        except Exception as e:
-            QApplication.restoreOverrideCursor()
-            QMessageBox.critical(self, "Fetch error", f"Could not fetch playlist: {e}")
-            return
-        QApplication.restoreOverrideCursor()
+        self.log("Fetching playlist metadata...")
+        self._set_fetching(True)
+        job = FetchRunnable(url)
+        job.signals.info_ready.connect(self.on_info_ready)
+        job.signals.info_error.connect(self.on_info_error)
+        self._fetch_signals = job.signals
+        QThreadPool.globalInstance().start(job)
+
+    def on_info_ready(self, info):
+        self._set_fetching(False)
         self.playlist = info
-        entries = info.get('entries', [])
-        self.list_widget.clear()
-        self.video_widgets.clear()
-        for e in entries:
-            widget = VideoWidget(e)
-            item = QListWidgetItem()
-            item.setSizeHint(widget.sizeHint())
-            self.list_widget.addItem(item)
-            self.list_widget.setItemWidget(item, widget)
-            vid = widget.video_id
-            self.video_widgets[vid] = (item, widget, e)
-        self.status_console.append(f"Loaded {len(entries)} items from playlist: {info.get('title')}")
+        self._cached_safe_title = self._safe_filename(info.get('title') or 'playlist')
+        # A single-video URL comes back fully resolved; list it as its own entry.
+        entries = (info.get('entries') or []) if 'entries' in info else [info]
+        self.model.set_entries(entries)
+        self.log(f"Loaded {len(entries)} items from playlist: {info.get('title')}")
+
+    def on_info_error(self, message):
+        self._set_fetching(False)
+        QMessageBox.critical(self, "Fetch error", f"Could not fetch playlist: {message}")
+
+    def _set_fetching(self, busy):
+        self.fetch_btn.setEnabled(not busy)
+        self.fetch_busy.setVisible(busy)
 
     def on_browse_output(self):
         folder = QFileDialog.getExistingDirectory(self, "Choose output folder", str(Path.cwd()))
@@ -311,32 +561,33 @@ class MainWindow(QWidget):
             self.output_input.setText(folder)
 
     def on_select_all(self):
-        for _, widget_tuple in self.video_widgets.items():
-            widget = widget_tuple[1]
-            widget.checkbox.setChecked(True)
+        self.model.set_all_checked(True)
 
     def on_deselect_all(self):
-        for _, widget_tuple in self.video_widgets.items():
-            widget = widget_tuple[1]
-            widget.checkbox.setChecked(False)
+        self.model.set_all_checked(False)
 
     def on_concurrency_changed(self, val):
         self.max_concurrent = int(val)
+        # Executors can't be resized: running downloads finish on the old pool,
+        # anything still queued there moves to the new one.
+        old_pool = self._pool
+        self._pool = ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix="dl")
+        jobs, self._jobs = self._jobs, {}
+        for future, (vid, args) in jobs.items():
+            if future.cancel():
+                self._submit(vid, args)
+        old_pool.shutdown(wait=False)
 
     def on_download_selected(self):
-        selected = []
-        for vid, (item, widget, entry) in self.video_widgets.items():
-            if widget.checkbox.isChecked():
-                selected.append((vid, widget, entry))
+        selected = self.model.checked_entries()
         if not selected:
             QMessageBox.information(self, "No selection", "No videos selected for download.")
             return
 
         out_root = Path(self.output_input.text().strip() or os.getcwd())
         out_root.mkdir(parents=True, exist_ok=True)
-        if self.per_playlist_folder_cb.isChecked() and self.playlist:
-            safe_title = self._safe_filename(self.playlist.get('title', 'playlist'))
-            out_dir = out_root / safe_title
+        if self.per_playlist_folder_cb.isChecked() and self._cached_safe_title:
+            out_dir = out_root / self._cached_safe_title
         else:
             out_dir = out_root
         out_dir = str(out_dir)
@@ -351,82 +602,101 @@ class MainWindow(QWidget):
             'quiet': True,
             'no_warnings': True
         }
+        if self.aria2c_cb.isChecked():
+            # Fetch each video's segments over parallel connections (yt_dlp already passes -x16 -s16)
+            ydl_base_opts['external_downloader'] = {'default': 'aria2c'}
+            ydl_base_opts['external_downloader_args'] = {'aria2c': ['-k1M', '--console-log-level=error']}
         total = len(selected)
-        self.status_console.append(f"Queueing {total} selected videos...")
+        self.log(f"Queueing {total} selected videos...")
         self.global_total = total
         self.global_done = 0
         self.global_progress.setValue(0)
-        semaphore = threading.Semaphore(self.max_concurrent)
-        self.active_workers = []
-
-        def worker_launcher(entry_tuple):
-            vid, widget, entry = entry_tuple
-            semaphore.acquire()
-            worker = DownloadWorker(entry, out_dir, ydl_base_opts, archive_path)
-            self.active_workers.append(worker)
-            worker.start()
-            def monitor():
-                worker.join()
-                semaphore.release()
-            t = threading.Thread(target=monitor, daemon=True)
-            t.start()
-
-        for entry_tuple in selected:
-            t = threading.Thread(target=worker_launcher, args=(entry_tuple,), daemon=True)
-            t.start()
-
-    def on_update_progress(self, video_id, percent, downloaded_bytes, total_bytes, status_text):
-        try:
-            item, widget, entry = self.video_widgets.get(video_id)
-        except:
-            widget = None
-            for _, t in self.video_widgets.items():
-                if t[1].video_id == video_id:
-                    widget = t[1]
-                    break
-        if widget:
-            widget.set_progress(percent, downloaded_bytes, total_bytes, status_text)
+        self._jobs = {f: job for f, job in self._jobs.items() if not f.done()}
+        for vid, entry in selected:
+            self._submit(vid, (entry, out_dir, ydl_base_opts, archive_path,
+                               self.signals, self.progress_queue, self._stop))
+
+    def _submit(self, video_id, args):
+        # The pool's queue is the only backpressure; the done callback reports the result.
+        future = self._pool.submit(run_download, *args)
+        self._jobs[future] = (video_id, args)
+        future.add_done_callback(partial(self._on_download_done, video_id))
+
+    def _on_download_done(self, video_id, future):
+        # Runs on the pool thread; the signal queues the result onto the UI thread.
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is None:
+            self.signals.finished_video.emit(video_id, True, "Done")
+        else:
+            self.signals.finished_video.emit(video_id, False, str(error))
+
+    def _drain_progress(self):
+        # Keep only the newest tick per video, then update the model in one batch.
+        latest = {}
+        q = self.progress_queue
+        while True:
+            try:
+                video_id, percent, status_text = q.get_nowait()
+            except Empty:
+                break
+            latest[video_id] = (percent, status_text)
+        updates = {}
+        for video_id, update in latest.items():
+            row = self.model.row_of(video_id)
+            if row >= 0:
+                updates[row] = update
+        self.model.set_progress_many(updates)
 
     def on_update_status(self, video_id, status_text):
-        if video_id in self.video_widgets:
-            _, widget, _ = self.video_widgets[video_id]
-            widget.set_status_text(status_text)
+        row = self.model.row_of(video_id)
+        if row >= 0:
+            self.model.set_status(row, status_text)
 
     def on_finished_video(self, video_id, success, message):
+        # Flush queued ticks first so a late "Processing/merging" can't overwrite the result.
+        self._drain_progress()
         self.global_done += 1
         if self.global_total:
             pct = int(100 * (self.global_done / self.global_total))
             self.global_progress.setValue(pct)
-        try:
-            item, widget, entry = self.video_widgets.get(video_id)
-        except:
-            widget = None
-            for _, t in self.video_widgets.items():
-                if t[1].video_id == video_id:
-                    widget = t[1]
-                    break
-        if widget:
+        row = self.model.row_of(video_id)
+        if row >= 0:
             if success:
-                widget.set_status_text("Done")
-                widget.progress.setValue(100)
+                self.model.set_progress(row, 100.0, "Done")
             else:
-                widget.set_status_text("Failed")
-        self.status_console.append(f"[{video_id}] {'OK' if success else 'FAILED'} — {message}")
+                self.model.set_status(row, "Failed")
+        self.log(f"[{video_id}] {'OK' if success else 'FAILED'} — {message}")
+
+    def log(self, message):
+        # Buffer console lines and append them in one block at most every 200ms.
+        if not self._console_buf:
+            QTimer.singleShot(200, self._flush_console)
+        self._console_buf.append(message)
+
+    def _flush_console(self):
+        if self._console_buf:
+            self.status_console.appendPlainText("\n".join(self._console_buf))
+            self._console_buf.clear()
 
     def _quality_to_format(self, q):
-        if q == "best":
-            return "best"
-        if q == "bestvideo+bestaudio":
-            return "bestvideo+bestaudio/best"
-        if q == "audio":
-            return "bestaudio"
+        fmt = self._FORMAT_MAP.get(q)
+        if fmt:
+            return fmt
         if q.isdigit():
             return f"bestvideo[height<={q}]+bestaudio/best[height<={q}]"
         return "best"
 
     def _safe_filename(self, s):
-        keep = (" ", ".", "_", "-")
-        return "".join(c for c in s if c.isalnum() or c in keep).rstrip()
+        return _UNSAFE_FILENAME_RE.sub("", s).rstrip()
+
+    def closeEvent(self, event):
+        # Drop queued downloads and abort running ones (on this and any swapped-out pool)
+        # so the process exits with the window instead of waiting for transfers to finish.
+        self._stop.set()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        super().closeEvent(event)
 
 def main():
     app = QApplication(sys.argv)
@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+import playlist_downloader_prototype as pd
+
+
+def _reference_fmt_bytes(b):
+    # The chained-comparison implementation fmt_bytes replaced
+    try:
+        b = float(b)
+    except (TypeError, ValueError):
+        return "?"
+    if b < 1024:
+        return f"{b:.0f}B"
+    if b < 1024**2:
+        return f"{b/1024:.1f}KB"
+    if b < 1024**3:
+        return f"{b/(1024**2):.1f}MB"
+    return f"{b/(1024**3):.1f}GB"
+
+
+@pytest.mark.parametrize("value, expected", [
+    (0, "0B"),
+    (1023, "1023B"),
+    (1024, "1.0KB"),
+    (1024**2 - 1, "1024.0KB"),
+    (1024**2, "1.0MB"),
+    (1024**3 - 1, "1024.0MB"),
+    (1024**3, "1.0GB"),
+    (5 * 1024**4, "5120.0GB"),
+    (1536.7, "1.5KB"),
+    (None, "?"),
+    ("12", "?"),
+])
+def test_unit_boundaries(value, expected):
+    assert pd.fmt_bytes(value) == expected
+
+
+def test_matches_reference_for_byte_counts():
+    rng = random.Random(0)
+    values = [rng.randrange(0, 2**42) for _ in range(100_000)]
+    values += [2**k + d for k in range(43) for d in (-1, 0, 1) if 2**k + d >= 0]
+    for v in values:
+        assert pd.fmt_bytes(v) == _reference_fmt_bytes(v), v
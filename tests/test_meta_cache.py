@@ -0,0 +1,63 @@
+import os
+import time
+
+import pytest
+
+import playlist_downloader_prototype as pd
+
+URL = "https://www.youtube.com/playlist?list=PL123"
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(pd, "META_CACHE_DIR", tmp_path / "cache")
+    return tmp_path / "cache"
+
+
+def test_round_trip(cache_dir):
+    info = {'title': "Playlist", 'entries': [{'id': "a"}]}
+    pd.store_cached_info(URL, info)
+    assert pd.load_cached_info(URL) == info
+    assert [p.suffix for p in cache_dir.iterdir()] == [".json"]
+
+
+def test_store_replaces_existing_entry(cache_dir):
+    pd.store_cached_info(URL, {'title': "old"})
+    pd.store_cached_info(URL, {'title': "new"})
+    assert pd.load_cached_info(URL) == {'title': "new"}
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_missing_entry():
+    assert pd.load_cached_info(URL) is None
+
+
+def test_expired_entry_is_ignored():
+    pd.store_cached_info(URL, {'title': "Playlist"})
+    stale = time.time() - pd.META_CACHE_TTL - 1
+    os.utime(pd._meta_cache_path(URL), (stale, stale))
+    assert pd.load_cached_info(URL) is None
+
+
+def test_corrupt_entry_is_ignored(cache_dir):
+    cache_dir.mkdir()
+    pd._meta_cache_path(URL).write_text("{not json", encoding="utf-8")
+    assert pd.load_cached_info(URL) is None
+
+
+def test_unwritable_cache_dir_is_ignored(tmp_path, monkeypatch):
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    monkeypatch.setattr(pd, "META_CACHE_DIR", blocker / "cache")
+    pd.store_cached_info(URL, {'title': "Playlist"})
+    assert pd.load_cached_info(URL) is None
+
+
+def test_unserializable_info_is_not_cached(cache_dir):
+    pd.store_cached_info(URL, {'title': object()})
+    assert pd.load_cached_info(URL) is None
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_keys_differ_per_url():
+    assert pd._meta_cache_path(URL) != pd._meta_cache_path(URL + "x")
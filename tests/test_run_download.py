@@ -0,0 +1,69 @@
+import functools
+import http.server
+import threading
+from queue import Queue
+
+import pytest
+
+import playlist_downloader_prototype as pd
+
+
+class _Recorder:
+    def __init__(self):
+        self.calls = []
+
+    def emit(self, *args):
+        self.calls.append(args)
+
+
+class _Signals:
+    def __init__(self):
+        self.update_status = _Recorder()
+        self.finished_video = _Recorder()
+
+
+class _QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(tmp_path):
+    root = tmp_path / "srv"
+    root.mkdir()
+    (root / "video.mp4").write_bytes(b"\0" * 4096)
+    srv = http.server.ThreadingHTTPServer(
+        ("127.0.0.1", 0), functools.partial(_QuietHandler, directory=str(root)))
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}"
+    srv.shutdown()
+
+
+def _run(entry, out_dir):
+    opts = {'format': 'best', 'outtmpl': "%(id)s.%(ext)s", 'quiet': True,
+            'no_warnings': True, 'noprogress': True}
+    signals = _Signals()
+    pd.run_download(entry, str(out_dir), opts, None, signals, Queue(), threading.Event())
+    return signals
+
+
+def test_expired_formats_fall_back_to_webpage_url(server, tmp_path):
+    # Stands in for a cached info dict whose signed format URL has since expired
+    entry = {
+        'id': 'video', 'title': 'video', 'extractor': 'generic', 'extractor_key': 'Generic',
+        'webpage_url': f"{server}/video.mp4",
+        'formats': [{'format_id': 'mp4', 'url': f"{server}/expired.mp4", 'ext': 'mp4'}],
+    }
+    out = tmp_path / "out"
+    signals = _run(entry, out)
+    assert (out / "video.mp4").exists()
+    assert ('video', "Retrying with fresh formats") in signals.update_status.calls
+
+
+def test_expired_formats_without_webpage_url_raise(server, tmp_path):
+    entry = {
+        'id': 'video', 'title': 'video', 'extractor': 'generic', 'extractor_key': 'Generic',
+        'formats': [{'format_id': 'mp4', 'url': f"{server}/expired.mp4", 'ext': 'mp4'}],
+    }
+    with pytest.raises(pd.DownloadError):
+        _run(entry, tmp_path / "out")
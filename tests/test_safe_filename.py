@@ -0,0 +1,26 @@
+import sys
+
+import playlist_downloader_prototype as pd
+
+KEEP = (" ", ".", "_", "-")
+
+
+def _safe_filename(s):
+    # _safe_filename never touches self
+    return pd.MainWindow._safe_filename(None, s)
+
+
+def test_keep_set_matches_isalnum_for_every_code_point():
+    kept = {c for c in map(chr, range(sys.maxunicode + 1))
+            if not pd._UNSAFE_FILENAME_RE.fullmatch(c)}
+    expected = {c for c in map(chr, range(sys.maxunicode + 1))
+                if c.isalnum() or c in KEEP}
+    assert kept == expected
+
+
+def test_strips_unsafe_characters_and_trailing_space():
+    assert _safe_filename('My: Playlist / 2024? ') == "My Playlist  2024"
+
+
+def test_keeps_non_latin_titles():
+    assert _safe_filename("قائمة التشغيل – ü.mp4") == "قائمة التشغيل  ü.mp4"
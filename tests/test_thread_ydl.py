@@ -0,0 +1,35 @@
+import threading
+
+import yt_dlp
+
+import playlist_downloader_prototype as pd
+
+INFO = {'id': 'dQw4w9WgXcQ', 'extractor_key': 'Youtube'}
+
+
+def _in_thread(fn):
+    result = []
+    t = threading.Thread(target=lambda: result.append(fn()))
+    t.start()
+    t.join()
+    return result[0]
+
+
+def test_reused_instance_sees_ids_recorded_by_other_threads(tmp_path):
+    opts = {'quiet': True, 'download_archive': str(tmp_path / "downloaded.txt")}
+
+    def run():
+        first = pd._thread_ydl(opts)
+        assert not first.in_download_archive(INFO)
+        # Another worker records the video after this thread's instance was built
+        _in_thread(lambda: yt_dlp.YoutubeDL(dict(opts)).record_download_archive(INFO))
+        second = pd._thread_ydl(opts)
+        return first is second, second.in_download_archive(INFO)
+
+    reused, archived = _in_thread(run)
+    assert reused
+    assert archived
+
+
+def test_load_archive_missing_file(tmp_path):
+    assert pd.load_archive(tmp_path / "nope.txt") == set()